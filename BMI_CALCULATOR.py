@@ -12,10 +12,11 @@ Features:
 - View history in a listbox (select to see details)
 - Plot BMI trend for selected user
 - Export history to CSV
+- Import entries from CSV (BMI recomputed in bulk)
 
 Run: python bmi_gui.py
-Requires: Python 3.x, matplotlib
-Install matplotlib: pip install matplotlib
+Requires: Python 3.x, matplotlib, numpy (numba optional, speeds up very large CSV imports)
+Install: pip install matplotlib numpy
 """
 
 import tkinter as tk
@@ -23,84 +24,366 @@ from tkinter import ttk, messagebox, filedialog
 import sqlite3
 from datetime import datetime
 import csv
+import threading
 import math
+import re
+from bisect import bisect_right
+from functools import lru_cache
+
+import numpy as np
 
 # Matplotlib embedding
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
+from dateutil.tz import tzlocal  # installed with matplotlib
 
 DB_NAME = "bmi_history.db"
+HISTORY_PAGE_SIZE = 200  # rows loaded into the history list per page
+MAX_WEIGHT_KG = 500  # accepted input ranges (exclusive of 0)
+MAX_HEIGHT_M = 3
+PLOT_DOWNSAMPLE_ABOVE = 2000  # longer user histories are downsampled before plotting
+PLOT_MAX_POINTS = 1000
 
 # ----------------------- Database helpers -----------------------
+_CONN = None
+
+
+def _conn():
+    # One persistent connection for the whole app. Autocommit mode
+    # (isolation_level=None); multi-statement writes use explicit BEGIN/COMMIT.
+    global _CONN
+    if _CONN is None:
+        # Larger statement cache so every hot-path query below stays prepared
+        _CONN = sqlite3.connect(DB_NAME, isolation_level=None, check_same_thread=False,
+                                cached_statements=256)
+        # WAL + synchronous=NORMAL: durable commits without an fsync per insert
+        _CONN.execute("PRAGMA journal_mode=WAL")
+        _CONN.execute("PRAGMA synchronous=NORMAL")
+    return _CONN
+
+
+# timestamp holds unix epoch seconds
+_ENTRIES_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        id INTEGER PRIMARY KEY,
+        name TEXT,
+        weight REAL,
+        height REAL,
+        bmi REAL,
+        category TEXT,
+        timestamp INTEGER
+    )
+"""
+
+# Hot-path statements, kept as constants so every call reuses the same
+# prepared statement from the connection's cache
+_SQL_INSERT = "INSERT INTO entries (name, weight, height, bmi, category, timestamp) VALUES (?,?,?,?,?,?)"
+# Timestamp taken by SQLite itself
+_SQL_INSERT_NOW = (
+    "INSERT INTO entries (name, weight, height, bmi, category, timestamp) "
+    "VALUES (?,?,?,?,?,CAST(strftime('%s','now') AS INTEGER))"
+)
+_SQL_TIMESTAMP_BY_ID = "SELECT timestamp FROM entries WHERE id=?"
+_SQL_HAS_ENTRIES = "SELECT 1 FROM entries LIMIT 1"
+_SQL_EXPORT = (
+    "SELECT id, name, weight, height, bmi, category, datetime(timestamp, 'unixepoch', 'localtime') "
+    "FROM entries ORDER BY timestamp DESC"
+)
+# Keyset paging over idx_entries_ts_id; id breaks ties between equal timestamps
+_SQL_HISTORY_FIRST = "SELECT id, name, bmi, category, timestamp FROM entries ORDER BY timestamp DESC, id DESC LIMIT ?"
+_SQL_HISTORY_PAGE = (
+    "SELECT id, name, bmi, category, timestamp FROM entries "
+    "WHERE (timestamp, id) < (?, ?) ORDER BY timestamp DESC, id DESC LIMIT ?"
+)
+_SQL_BY_ID = "SELECT id, name, weight, height, bmi, category, timestamp FROM entries WHERE id=?"
+_SQL_FOR_USER = "SELECT id, name, weight, height, bmi, category, timestamp FROM entries WHERE name=? ORDER BY timestamp"
+
+
+def _migrate_text_timestamps(conn):
+    # Older databases stored local-time ISO strings in a TEXT column; rebuild
+    # the table with INTEGER epoch seconds ('utc' treats the input as local time).
+    # Values SQLite can't parse (NULL, '', hand-edited text) become 0 rather
+    # than NULL so every row stays displayable.
+    cols = {r[1]: r[2] for r in conn.execute("PRAGMA table_info(entries)")}
+    if cols.get('timestamp', '').upper() != 'TEXT':
+        return
+    conn.execute("BEGIN")
+    try:
+        conn.execute(_ENTRIES_SCHEMA.format(table='entries_new'))
+        conn.execute(
+            "INSERT INTO entries_new (id, name, weight, height, bmi, category, timestamp) "
+            "SELECT id, name, weight, height, bmi, category, COALESCE(CAST(strftime('%s', timestamp, 'utc') AS INTEGER), 0) FROM entries"
+        )
+        conn.execute("DROP TABLE entries")
+        conn.execute("ALTER TABLE entries_new RENAME TO entries")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
 def init_db():
-    conn = sqlite3.connect(DB_NAME)
+    conn = _conn()
     c = conn.cursor()
-    c.execute(
-        """
-        CREATE TABLE IF NOT EXISTS entries (
-            id INTEGER PRIMARY KEY,
-            name TEXT,
-            weight REAL,
-            height REAL,
-            bmi REAL,
-            category TEXT,
-            timestamp TEXT
-        )
-        """
-    )
-    conn.commit()
-    conn.close()
+    c.execute(_ENTRIES_SCHEMA.format(table='entries'))
+    _migrate_text_timestamps(conn)
+    # Serves WHERE name=? ORDER BY timestamp without a scan or sort step
+    c.execute("CREATE INDEX IF NOT EXISTS idx_entries_name_ts ON entries (name, timestamp)")
+    # Serves the history pages: newest first, without a scan or sort step
+    c.execute("CREATE INDEX IF NOT EXISTS idx_entries_ts_id ON entries (timestamp, id)")
 
 
 def save_entry(name, weight, height, bmi, category):
+    # Returns (id, timestamp) of the inserted row
+    c = _conn().cursor()
+    c.execute(_SQL_INSERT_NOW, (name, weight, height, bmi, category))
+    entry_id = c.lastrowid
+    # Read the SQLite-assigned timestamp back by primary key
+    c.execute(_SQL_TIMESTAMP_BY_ID, (entry_id,))
+    ts = c.fetchone()[0]
+    get_entries_for_user.cache_clear()
+    return entry_id, ts
+
+
+def save_entries_bulk(rows, conn=None):
+    # rows: iterable of (name, weight, height, bmi, category, timestamp)
+    # with timestamp in unix epoch seconds
+    # One transaction for the whole batch (single fsync). Worker threads pass
+    # their own autocommit connection; the default is the shared one.
+    if conn is None:
+        conn = _conn()
+    conn.execute("BEGIN")
+    try:
+        conn.executemany(_SQL_INSERT, rows)
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+    get_entries_for_user.cache_clear()
+
+
+def has_entries():
+    c = _conn().cursor()
+    c.execute(_SQL_HAS_ENTRIES)
+    return c.fetchone() is not None
+
+
+def export_entries_csv(path):
+    # Safe to call from a worker thread: uses its own connection rather than
+    # the shared one. Rows stream from the cursor (timestamps formatted to
+    # local time by SQLite) straight into csv.writer.
     conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    ts = datetime.now().isoformat(sep=' ', timespec='seconds')
-    c.execute(
-        "INSERT INTO entries (name, weight, height, bmi, category, timestamp) VALUES (?,?,?,?,?,?)",
-        (name, weight, height, bmi, category, ts)
-    )
-    conn.commit()
-    conn.close()
+    try:
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['id','name','weight','height','bmi','category','timestamp'])
+            writer.writerows(conn.execute(_SQL_EXPORT))
+    finally:
+        conn.close()
+
+
+def get_history_display_rows(limit=HISTORY_PAGE_SIZE, before=None):
+    # Only the columns the history listbox shows: (id, name, bmi, category, timestamp).
+    # before: (timestamp, id) of the last row already shown; None for the first page
+    c = _conn().cursor()
+    if before is None:
+        c.execute(_SQL_HISTORY_FIRST, (limit,))
+    else:
+        c.execute(_SQL_HISTORY_PAGE, (before[0], before[1], limit))
+    return c.fetchall()
 
 
-def get_all_entries():
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute("SELECT id, name, weight, height, bmi, category, timestamp FROM entries ORDER BY timestamp DESC")
-    rows = c.fetchall()
-    conn.close()
-    return rows
+def get_entry_by_id(entry_id):
+    # Full row lookup by rowid
+    c = _conn().cursor()
+    c.execute(_SQL_BY_ID, (entry_id,))
+    return c.fetchone()
 
 
+@lru_cache(maxsize=64)
 def get_entries_for_user(name):
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute("SELECT id, name, weight, height, bmi, category, timestamp FROM entries WHERE name=? ORDER BY timestamp", (name,))
-    rows = c.fetchall()
-    conn.close()
-    return rows
+    # Cached per user; the save helpers clear it after every write.
+    # A tuple so callers can't mutate the cached rows.
+    c = _conn().cursor()
+    c.execute(_SQL_FOR_USER, (name,))
+    return tuple(c.fetchall())
+
+
+def format_timestamp(ts):
+    # Epoch seconds -> local 'YYYY-MM-DD HH:MM:SS' for display
+    return datetime.fromtimestamp(ts).isoformat(sep=' ', timespec='seconds')
+
+
+def format_history_row(r):
+    # r: (id, name, bmi, category, timestamp) -> "[timestamp] name — BMI: x (category)"
+    return f"[{format_timestamp(r[4])}] {r[1]} — BMI: {r[2]} ({r[3]})"
+
 
 # ----------------------- BMI logic -----------------------
 
+# Plain decimal numbers only ("70", "1.75", ".5", "-3"); rejects "abc",
+# "inf", "nan" and exponent forms without raising
+_NUM_RE = re.compile(r'-?(?:\d+(?:\.\d*)?|\.\d+)')
+
+
+def parse_number(text):
+    # float value of text, or None if it is not a plain decimal number
+    text = text.strip()
+    if not _NUM_RE.fullmatch(text):
+        return None
+    return float(text)
+
+
 def calculate_bmi_value(weight, height):
     # weight: kg, height: meters
     if height <= 0:
         raise ValueError("Height must be positive")
-    bmi = weight / (height ** 2)
+    bmi = weight / (height * height)
     return bmi
 
 
+# WHO standard categories: BMI_CATEGORIES[i] covers
+# [_BMI_THRESHOLDS[i-1], _BMI_THRESHOLDS[i]). Category codes produced by
+# compute_bmi_and_cat index into the same table.
+_BMI_THRESHOLDS = (18.5, 25, 30)
+BMI_CATEGORIES = ("Underweight", "Normal weight", "Overweight", "Obese")
+
+
 def bmi_category(bmi):
-    # WHO standard categories
-    if bmi < 18.5:
-        return "Underweight"
-    elif 18.5 <= bmi < 25:
-        return "Normal weight"
-    elif 25 <= bmi < 30:
-        return "Overweight"
-    else:
-        return "Obese"
+    return BMI_CATEGORIES[bisect_right(_BMI_THRESHOLDS, bmi)]
+
+
+# Below this many rows the plain Python loop beats numba's import + cache load
+_NUMBA_MIN_ROWS = 1_000_000
+# numba is optional and only imported on first use by compute_bmi_and_cat
+numba = None
+_bulk_bmi_kernel = None  # compiled lazily; False when numba is unavailable
+
+
+def _bulk_bmi_loop(weights, heights, out_bmi, out_cat):
+    # numba kernel source. Loop form on purpose: numba vectorizes it better
+    # than array expressions
+    for i in numba.prange(weights.size):
+        b = weights[i] / (heights[i] * heights[i])
+        out_bmi[i] = b
+        if b < 18.5:
+            out_cat[i] = 0
+        elif b < 25:
+            out_cat[i] = 1
+        elif b < 30:
+            out_cat[i] = 2
+        else:
+            out_cat[i] = 3
+
+
+def _bulk_bmi_python(weights, heights, out_bmi, out_cat):
+    # Same contract as the numba kernel, without numba
+    for i, (w, h) in enumerate(zip(weights.tolist(), heights.tolist())):
+        b = w / (h * h)
+        out_bmi[i] = b
+        out_cat[i] = bisect_right(_BMI_THRESHOLDS, b)
+
+
+def _get_bulk_bmi_kernel():
+    # Import numba and compile on first use only; cache=True keeps the
+    # compiled kernel on disk so later sessions skip compilation
+    global numba, _bulk_bmi_kernel
+    if _bulk_bmi_kernel is None:
+        try:
+            import numba
+        except ImportError:
+            _bulk_bmi_kernel = False
+        else:
+            _bulk_bmi_kernel = numba.njit(parallel=True, fastmath=True, cache=True)(_bulk_bmi_loop)
+    return _bulk_bmi_kernel
+
+
+def compute_bmi_and_cat(weights, heights):
+    # Bulk counterpart of calculate_bmi_value + bmi_category.
+    # Returns (bmi float64 array, category code int8 array)
+    weights = np.ascontiguousarray(weights, dtype=np.float64)
+    heights = np.ascontiguousarray(heights, dtype=np.float64)
+    out_bmi = np.empty(weights.size, dtype=np.float64)
+    out_cat = np.empty(weights.size, dtype=np.int8)
+    kernel = _get_bulk_bmi_kernel() if weights.size >= _NUMBA_MIN_ROWS else None
+    (kernel or _bulk_bmi_python)(weights, heights, out_bmi, out_cat)
+    return out_bmi, out_cat
+
+
+def import_entries_csv(path):
+    # Read name/weight/height[/timestamp] rows (the export format works),
+    # recompute BMI + category in bulk and save in one transaction.
+    # Safe to call from a worker thread: writes through its own connection.
+    # Returns (imported, skipped).
+    names, weights, heights, stamps = [], [], [], []
+    skipped = 0
+    now = int(datetime.now().timestamp())
+    with open(path, newline='', encoding='utf-8') as f:
+        for rec in csv.DictReader(f):
+            name = (rec.get('name') or '').strip()
+            weight = parse_number(rec.get('weight') or '')
+            height = parse_number(rec.get('height') or '')
+            # Same ranges as the GUI input validation
+            if (not name or weight is None or height is None
+                    or not (0 < weight <= MAX_WEIGHT_KG) or not (0 < height <= MAX_HEIGHT_M)):
+                skipped += 1
+                continue
+            ts = rec.get('timestamp')
+            try:
+                ts = int(datetime.fromisoformat(ts).timestamp()) if ts else now
+            except ValueError:
+                skipped += 1
+                continue
+            names.append(name)
+            weights.append(weight)
+            heights.append(height)
+            stamps.append(ts)
+    if not names:
+        return 0, skipped
+    bmis, cats = compute_bmi_and_cat(weights, heights)
+    conn = sqlite3.connect(DB_NAME, isolation_level=None)
+    try:
+        # Python's round() to match on_calculate exactly (np.round can differ)
+        save_entries_bulk(
+            ((names[i], weights[i], heights[i], round(float(bmis[i]), 2), BMI_CATEGORIES[cats[i]], stamps[i])
+             for i in range(len(names))),
+            conn
+        )
+    finally:
+        conn.close()
+    return len(names), skipped
+
+
+# ----------------------- Plot helpers -----------------------
+
+def lttb_indices(x, y, threshold):
+    # Largest-Triangle-Three-Buckets downsampling: returns the indices of
+    # `threshold` points that keep the visual shape of the (x, y) series.
+    # First and last points are always kept.
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    every = (n - 2) / (threshold - 2)
+    idx = np.empty(threshold, dtype=np.int64)
+    idx[0] = 0
+    a = 0
+    for i in range(threshold - 2):
+        # Average of the next bucket is the third triangle vertex
+        nxt_start = int((i + 1) * every) + 1
+        nxt_end = min(int((i + 2) * every) + 1, n)
+        avg_x = x[nxt_start:nxt_end].mean()
+        avg_y = y[nxt_start:nxt_end].mean()
+        # Pick the point in the current bucket with the largest triangle area
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(area.argmax())
+        idx[i + 1] = a
+    idx[-1] = n - 1
+    return idx
+
 
 # ----------------------- GUI -----------------------
 
@@ -109,68 +392,83 @@ class BMIGUI(tk.Tk):
         super().__init__()
         self.title("BMI Calculator — Advanced GUI")
         self.geometry("900x600")
-        self.resizable(False, False)
+        self.minsize(760, 520)
+
+        # Main frames: inputs/result on the left, history on the right,
+        # plot across the bottom. The history and plot areas take extra space.
+        self.columnconfigure(1, weight=1)
+        self.rowconfigure(1, weight=1)
+        self.rowconfigure(2, weight=1)
 
-        # Main frames
         input_frame = ttk.LabelFrame(self, text="Enter Data")
-        input_frame.place(x=10, y=10, width=380, height=220)
+        input_frame.grid(row=0, column=0, sticky='nsew', padx=(10, 5), pady=(10, 5))
 
         result_frame = ttk.LabelFrame(self, text="Result")
-        result_frame.place(x=10, y=240, width=380, height=150)
+        result_frame.grid(row=1, column=0, sticky='nsew', padx=(10, 5), pady=5)
 
         history_frame = ttk.LabelFrame(self, text="History")
-        history_frame.place(x=400, y=10, width=480, height=380)
+        history_frame.grid(row=0, column=1, rowspan=2, sticky='nsew', padx=(5, 10), pady=(10, 5))
 
         plot_frame = ttk.LabelFrame(self, text="Trend / Plot")
-        plot_frame.place(x=10, y=400, width=870, height=190)
+        plot_frame.grid(row=2, column=0, columnspan=2, sticky='nsew', padx=10, pady=(5, 10))
 
         # Input fields
-        ttk.Label(input_frame, text="Name:").place(x=10, y=12)
+        input_frame.columnconfigure(1, weight=1)
+        ttk.Label(input_frame, text="Name:").grid(row=0, column=0, sticky='w', padx=10, pady=8)
         self.name_var = tk.StringVar()
-        self.name_entry = ttk.Entry(input_frame, textvariable=self.name_var)
-        self.name_entry.place(x=100, y=12, width=240)
+        self.name_entry = ttk.Entry(input_frame, textvariable=self.name_var, width=30)
+        self.name_entry.grid(row=0, column=1, sticky='ew', padx=10, pady=8)
 
-        ttk.Label(input_frame, text="Weight (kg):").place(x=10, y=52)
+        ttk.Label(input_frame, text="Weight (kg):").grid(row=1, column=0, sticky='w', padx=10, pady=8)
         self.weight_var = tk.StringVar()
-        self.weight_entry = ttk.Entry(input_frame, textvariable=self.weight_var)
-        self.weight_entry.place(x=100, y=52, width=120)
+        self.weight_entry = ttk.Entry(input_frame, textvariable=self.weight_var, width=15)
+        self.weight_entry.grid(row=1, column=1, sticky='w', padx=10, pady=8)
 
-        ttk.Label(input_frame, text="Height (m):").place(x=10, y=92)
+        ttk.Label(input_frame, text="Height (m):").grid(row=2, column=0, sticky='w', padx=10, pady=8)
         self.height_var = tk.StringVar()
-        self.height_entry = ttk.Entry(input_frame, textvariable=self.height_var)
-        self.height_entry.place(x=100, y=92, width=120)
+        self.height_entry = ttk.Entry(input_frame, textvariable=self.height_var, width=15)
+        self.height_entry.grid(row=2, column=1, sticky='w', padx=10, pady=8)
 
         # Buttons
         calc_btn = ttk.Button(input_frame, text="Calculate & Save", command=self.on_calculate)
-        calc_btn.place(x=10, y=140, width=160)
+        calc_btn.grid(row=3, column=0, sticky='ew', padx=10, pady=(12, 10))
 
         clear_btn = ttk.Button(input_frame, text="Clear Fields", command=self.clear_fields)
-        clear_btn.place(x=200, y=140, width=140)
+        clear_btn.grid(row=3, column=1, sticky='w', padx=10, pady=(12, 10))
 
         # Result labels
         self.result_bmi = tk.StringVar(value="BMI: —")
         self.result_cat = tk.StringVar(value="Category: —")
-        ttk.Label(result_frame, textvariable=self.result_bmi, font=(None, 14)).place(x=10, y=10)
-        ttk.Label(result_frame, textvariable=self.result_cat, font=(None, 14)).place(x=10, y=50)
+        ttk.Label(result_frame, textvariable=self.result_bmi, font=(None, 14)).grid(row=0, column=0, sticky='w', padx=10, pady=(10, 5))
+        ttk.Label(result_frame, textvariable=self.result_cat, font=(None, 14)).grid(row=1, column=0, sticky='w', padx=10, pady=5)
 
         # History listbox + scrollbar
+        history_frame.rowconfigure(0, weight=1)
+        for col in range(3):
+            history_frame.columnconfigure(col, weight=1)
         self.history_list = tk.Listbox(history_frame)
-        self.history_list.place(x=10, y=10, width=440, height=300)
+        self.history_list.grid(row=0, column=0, columnspan=3, sticky='nsew', padx=(10, 0), pady=(10, 5))
         self.history_list.bind('<<ListboxSelect>>', self.on_history_select)
 
         sb = ttk.Scrollbar(history_frame, orient='vertical', command=self.history_list.yview)
-        sb.place(x=452, y=10, height=300)
+        sb.grid(row=0, column=3, sticky='ns', padx=(0, 10), pady=(10, 5))
         self.history_list.configure(yscrollcommand=sb.set)
 
         # History buttons
+        self.load_more_btn = ttk.Button(history_frame, text="Load More", command=self.load_more_history)
+        self.load_more_btn.grid(row=1, column=0, sticky='ew', padx=(10, 5), pady=2)
+
+        import_btn = ttk.Button(history_frame, text="Import CSV", command=self.import_csv)
+        import_btn.grid(row=1, column=1, sticky='ew', padx=5, pady=2)
+
         refresh_btn = ttk.Button(history_frame, text="Refresh History", command=self.load_history)
-        refresh_btn.place(x=10, y=320, width=120)
+        refresh_btn.grid(row=2, column=0, sticky='ew', padx=(10, 5), pady=(2, 10))
 
         export_btn = ttk.Button(history_frame, text="Export CSV", command=self.export_csv)
-        export_btn.place(x=150, y=320, width=120)
+        export_btn.grid(row=2, column=1, sticky='ew', padx=5, pady=(2, 10))
 
         plot_btn = ttk.Button(history_frame, text="Plot Selected User", command=self.plot_selected_user)
-        plot_btn.place(x=290, y=320, width=160)
+        plot_btn.grid(row=2, column=2, columnspan=2, sticky='ew', padx=(5, 10), pady=(2, 10))
 
         # Matplotlib figure
         self.fig = Figure(figsize=(8.2, 2.7), dpi=100)
@@ -178,8 +476,14 @@ class BMIGUI(tk.Tk):
         self.ax.set_title('BMI Trend')
         self.ax.set_xlabel('Time')
         self.ax.set_ylabel('BMI')
+        self.ax.grid(True)
+        # Single trend line, updated in place on each plot
+        self._line, = self.ax.plot([], [], marker='o')
+        self._plotted_name = None
+        plot_frame.rowconfigure(0, weight=1)
+        plot_frame.columnconfigure(0, weight=1)
         self.canvas = FigureCanvasTkAgg(self.fig, master=plot_frame)
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.canvas.get_tk_widget().grid(row=0, column=0, sticky='nsew')
 
         # Initialize
         self.load_history()
@@ -189,15 +493,14 @@ class BMIGUI(tk.Tk):
         name = self.name_var.get().strip()
         if not name:
             raise ValueError("Name cannot be empty")
-        try:
-            weight = float(self.weight_var.get())
-            height = float(self.height_var.get())
-        except ValueError:
+        weight = parse_number(self.weight_var.get())
+        height = parse_number(self.height_var.get())
+        if weight is None or height is None:
             raise ValueError("Weight and height must be numbers")
-        if weight <= 0 or weight > 500:
-            raise ValueError("Weight must be between 0 and 500 kg")
-        if height <= 0 or height > 3:
-            raise ValueError("Height must be between 0 and 3 meters")
+        if weight <= 0 or weight > MAX_WEIGHT_KG:
+            raise ValueError(f"Weight must be between 0 and {MAX_WEIGHT_KG} kg")
+        if height <= 0 or height > MAX_HEIGHT_M:
+            raise ValueError(f"Height must be between 0 and {MAX_HEIGHT_M} meters")
         return name, weight, height
 
     def on_calculate(self):
@@ -208,11 +511,16 @@ class BMIGUI(tk.Tk):
             bmi_rounded = round(bmi, 2)
             cat = bmi_category(bmi)
             # Save
-            save_entry(name, weight, height, bmi_rounded, cat)
+            entry_id, ts = save_entry(name, weight, height, bmi_rounded, cat)
             self.result_bmi.set(f"BMI: {bmi_rounded}")
             self.result_cat.set(f"Category: {cat}")
+            # Newest entry goes on top; no full reload needed
+            self.history_list.insert(0, format_history_row((entry_id, name, bmi_rounded, cat, ts)))
+            self._history_ids.insert(0, entry_id)
+            if self._history_cursor is None:
+                # List was empty; Load More must continue below this entry
+                self._history_cursor = (ts, entry_id)
             messagebox.showinfo("Saved", f"Entry saved for {name} (BMI: {bmi_rounded})")
-            self.load_history()
         except Exception as e:
             messagebox.showerror("Input error", str(e))
 
@@ -224,21 +532,34 @@ class BMIGUI(tk.Tk):
         self.result_cat.set("Category: —")
 
     def load_history(self):
+        # Reload the first page only; older entries come in via "Load More"
         self.history_list.delete(0, tk.END)
-        rows = get_all_entries()
-        for r in rows:
-            # Display: [timestamp] name — BMI
-            display = f"[{r[6]}] {r[1]} — BMI: {r[4]} ({r[5]})"
-            self.history_list.insert(tk.END, display)
-        # Keep rows in memory for selection mapping
-        self._history_rows = rows
+        self._history_ids = []
+        self._history_cursor = None
+        self.load_more_history()
+
+    def load_more_history(self):
+        rows = get_history_display_rows(HISTORY_PAGE_SIZE, self._history_cursor)
+        displays = [format_history_row(r) for r in rows]
+        # Single insert call: one Tcl round trip for the whole page
+        if displays:
+            self.history_list.insert(tk.END, *displays)
+        # Keep only ids in memory; full rows are fetched on selection
+        self._history_ids.extend(r[0] for r in rows)
+        if rows:
+            # Keyset for the next page: (timestamp, id) of the oldest row shown
+            self._history_cursor = (rows[-1][4], rows[-1][0])
+        # A short page means there is nothing older left to load
+        self.load_more_btn.state(['disabled'] if len(rows) < HISTORY_PAGE_SIZE else ['!disabled'])
 
     def on_history_select(self, event):
         sel = event.widget.curselection()
         if not sel:
             return
         idx = sel[0]
-        row = self._history_rows[idx]
+        row = get_entry_by_id(self._history_ids[idx])
+        if row is None:
+            return
         # Populate fields with selected
         self.name_var.set(row[1])
         self.weight_var.set(str(row[2]))
@@ -247,21 +568,48 @@ class BMIGUI(tk.Tk):
         self.result_cat.set(f"Category: {row[5]}")
 
     def export_csv(self):
-        rows = get_all_entries()
-        if not rows:
+        if not has_entries():
             messagebox.showinfo("No data", "No history to export")
             return
         path = filedialog.asksaveasfilename(defaultextension='.csv', filetypes=[('CSV files','*.csv')])
         if not path:
             return
+        # Write off the Tk main thread so the GUI stays responsive
+        t = threading.Thread(target=self._export_worker, args=(path,))
+        t.daemon = True
+        t.start()
+
+    def _export_worker(self, path):
+        # Runs in a worker thread; results are posted back to Tk via after()
         try:
-            with open(path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(['id','name','weight','height','bmi','category','timestamp'])
-                writer.writerows(rows)
-            messagebox.showinfo("Exported", f"Exported history to {path}")
+            export_entries_csv(path)
         except Exception as e:
-            messagebox.showerror("Export failed", str(e))
+            self.after(0, messagebox.showerror, "Export failed", str(e))
+            return
+        self.after(0, messagebox.showinfo, "Exported", f"Exported history to {path}")
+
+    def import_csv(self):
+        path = filedialog.askopenfilename(filetypes=[('CSV files','*.csv')])
+        if not path:
+            return
+        # Parse and insert off the Tk main thread so the GUI stays responsive
+        t = threading.Thread(target=self._import_worker, args=(path,))
+        t.daemon = True
+        t.start()
+
+    def _import_worker(self, path):
+        # Runs in a worker thread; results are posted back to Tk via after()
+        try:
+            imported, skipped = import_entries_csv(path)
+        except Exception as e:
+            self.after(0, messagebox.showerror, "Import failed", str(e))
+            return
+        self.after(0, self._import_done, path, imported, skipped)
+
+    def _import_done(self, path, imported, skipped):
+        messagebox.showinfo("Imported", f"Imported {imported} entries ({skipped} skipped) from {path}")
+        if imported:
+            self.load_history()
 
     def plot_selected_user(self):
         sel = self.history_list.curselection()
@@ -269,25 +617,37 @@ class BMIGUI(tk.Tk):
             messagebox.showinfo("Choose user", "Select an entry in history (any entry of the user) to plot that user's trend")
             return
         idx = sel[0]
-        row = self._history_rows[idx]
+        row = get_entry_by_id(self._history_ids[idx])
+        if row is None:
+            messagebox.showinfo("No data", "Selected entry no longer exists")
+            return
         name = row[1]
         entries = get_entries_for_user(name)
         if not entries:
             messagebox.showinfo("No data", f"No entries found for {name}")
             return
         # Extract timestamps and bmi
-        times = [datetime.fromisoformat(r[6]) for r in entries]
-        bmis = [r[4] for r in entries]
-
-        # Clear and plot
-        self.ax.clear()
-        self.ax.plot(times, bmis, marker='o')
-        self.ax.set_title(f'BMI Trend — {name}')
-        self.ax.set_xlabel('Time')
-        self.ax.set_ylabel('BMI')
-        self.ax.grid(True)
+        epochs = np.fromiter((r[6] for r in entries), dtype=np.int64, count=len(entries))
+        bmis = np.fromiter((r[4] for r in entries), dtype=np.float64, count=len(entries))
+        # Bound draw cost for very long histories
+        if len(entries) > PLOT_DOWNSAMPLE_ABOVE:
+            keep = lttb_indices(epochs, bmis, PLOT_MAX_POINTS)
+            epochs = epochs[keep]
+            bmis = bmis[keep]
+        # Epoch ints map straight onto (UTC) datetime64
+        times = epochs.astype('datetime64[s]')
+
+        # Update the cached line instead of rebuilding the axes. The date axis
+        # formats in the local zone, DST included, like the history list.
+        self.ax.xaxis.axis_date(tzlocal())
+        self._line.set_data(times, bmis)
+        self.ax.relim()
+        self.ax.autoscale_view()
+        if name != self._plotted_name:
+            self.ax.set_title(f'BMI Trend — {name}')
+            self._plotted_name = name
         self.fig.autofmt_xdate()
-        self.canvas.draw()
+        self.canvas.draw_idle()
 
 
 if __name__ == '__main__':